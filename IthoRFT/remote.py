@@ -5,8 +5,9 @@ import os
 import random
 import asyncio
 import time
-import re
 import json
+import struct
+import threading
 import serial
 
 from IthoRFT.const import REQUIRED_EVOFW3_VERSION, TIMEOUT_SELF_TEST, TIMEOUT_PAIRING
@@ -14,6 +15,185 @@ from IthoRFT.const import REQUIRED_EVOFW3_VERSION, TIMEOUT_SELF_TEST, TIMEOUT_PA
 
 _LOGGER = logging.getLogger(__name__)
 
+_VERSION_PREFIX = "# evofw3 "
+
+# 31DA status payload (29 bytes, big-endian, temperatures signed)
+_STATUS_STRUCT = struct.Struct(">BBBHBBhhhhHBBBBHBBHH")
+
+# 31DA capability flags, most significant bit first
+_CAPABILITY_NAMES = (
+    "Off",
+    "Away",
+    "Timer",
+    "Boost",
+    "Auto",
+    "Speed 4",
+    "Speed 5",
+    "Speed 6",
+    "Speed 7",
+    "Speed 8",
+    "Speed 9",
+    "Speed 10",
+    "Night",
+    "Reserved",
+    "Post Heater",
+    "Pre Heater",
+)
+_CAPABILITY_TABLE = tuple(
+    (1 << (15 - i), name) for i, name in enumerate(_CAPABILITY_NAMES)
+)
+# Joined capability string per raw bitmask (a unit only reports a few)
+_CAPABILITY_CACHE: dict[int, str] = {}
+
+# 31DA quality base and flags bitmasks
+_QUALITY_BASE_MASKS = (("th", 0b10000000), ("co", 0b01000000), ("voc", 0b00100000))
+_FLAGS_MASKS = (
+    ("fault_active", 0b10000000),
+    ("filter_dirty", 0b01000000),
+    ("defrost_active", 0b00100000),
+)
+
+# 31DA active speed mode (lower 5 bits of the flags byte)
+_ACTIVE_SPEED_MODES = {
+    0: "OFF",
+    1: "Speed 1",
+    2: "Speed 2",
+    3: "Speed 3",
+    4: "Speed 4",
+    5: "Speed 5",
+    6: "Speed 6",
+    7: "Speed 7",
+    8: "Speed 8",
+    9: "Speed 9",
+    10: "Speed 10",
+    11: "Speed 1 Temporary Override",
+    12: "Speed 2 Temporary Override",
+    13: "Speed 3 Temporary Override",
+    14: "Speed 4 Temporary Override",
+    15: "Speed 5 Temporary Override",
+    16: "Speed 6 Temporary Override",
+    17: "Speed 7 Temporary Override",
+    18: "Speed 8 Temporary Override",
+    19: "Speed 9 Temporary Override",
+    20: "Speed 10 Temporary Override",
+    21: "Away",
+    22: "Abs Minimum Speed",
+    23: "Abs Maximum Speed",
+    24: "Auto",
+    25: "Night",
+}
+
+# Remote (536-0150) command code, length and payload
+_COMMAND_MAP = {
+    "night": "22F8 003 630203",
+    "auto": "22F1 003 630304",
+    "low": "22F1 003 630204",
+    "high": "22F1 003 630404",
+    "timer10": "22F3 003 63000A",
+    "timer20": "22F3 003 630014",
+    "timer30": "22F3 003 63001E",
+}
+
+_VALID_VERBS = frozenset((" I", "RQ", "RP", " W"))
+
+
+def _is_frame(data):
+    """"Cheap fixed-layout check to reject lines that can never be a frame."""
+
+    # 072  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
+    return (
+        len(data) > 50
+        and data[3] == " "
+        and data[4:6] in _VALID_VERBS
+        and data[40] == " "
+        and data[45] == " "
+        and data[49] == " "
+    )
+
+
+_DIGITS = frozenset("0123456789")
+
+
+def _is_device_address(address):
+    """"Check the NN:NNNNNN shape of a device address (e.g. 29:012345)."""
+
+    return (
+        isinstance(address, str)
+        and len(address) == 9
+        and address[2] == ":"
+        and all(char in _DIGITS for char in address[:2] + address[3:])
+    )
+
+
+def _clip(value, low, high):
+    """"Return the value when within [low, high], otherwise None."""
+
+    return value if low <= value <= high else None
+
+
+def _percentage(raw):
+    """"Scale a 31DA percentage (0.5 %) and range-check it."""
+
+    return _clip(raw / 2, 0.0, 100.0)
+
+
+def _temperature(raw):
+    """"Scale a signed 31DA temperature (0.01 °C) and range-check it."""
+
+    return _clip(raw / 100.0, -273.15, 327.66)
+
+
+def _version_tuple(version):
+    """"Convert an evofw3 version string (e.g. 0.7.1, 0.7.1-dev) to a comparable tuple."""
+
+    # Leading digits of each dotted part, stop at the first part without any
+    parts = []
+    for part in version.split("."):
+        digits = len(part) - len(part.lstrip("0123456789"))
+        if not digits:
+            break
+        parts.append(int(part[:digits]))
+    return tuple(parts)
+
+
+_REQUIRED_VERSION = _version_tuple(REQUIRED_EVOFW3_VERSION)
+
+
+def _new_status_data():
+    """"Create the (empty) 31DA status dictionary, updated in place on every message."""
+
+    return {
+        "air_quality": None,
+        "quality_base": {
+            "th": False,
+            "co": False,
+            "voc": False,
+            "outdoor_improved": False,
+        },
+        "co2_level": None,
+        "outdoor_humidity": None,
+        "indoor_humidity": None,
+        "exhaust_temperature": None,
+        "supply_temperature": None,
+        "indoor_temperature": None,
+        "outdoor_temperature": None,
+        "capability_flags": "",
+        "bypass_position": None,
+        "flags": {
+            "fault_active": False,
+            "filter_dirty": False,
+            "defrost_active": False,
+            "active_speed_mode": "Unknown",
+        },
+        "exhaust_fan_speed": None,
+        "inlet_fan_speed": None,
+        "remaining_time": None,
+        "pos_theater": None,
+        "pre_heater": None,
+        "inlet_flow": None,
+        "exhaust_flow": None,
+    }
+
 
 # Device Address is build as follows:
 # 0x743039 -> 29:012345
@@ -61,9 +241,15 @@ class IthoRFTRemote:
         self.task = None
         self.data_callback = None
         self.pair_callback = None
-        self.data = {}
+        self.data = _new_status_data()
         self.is_pairing = False
         self.pairing_timeout = 0
+        self._receive_buffer = bytearray()
+        self._log_date = None
+        self._log_file = None
+        self._loop = None
+        self._pairing_started = None
+        self._saved_settings = None
 
         # TODO: Sequence number is checked by the Itho machine!
         #  (000 is send after battery swap, so 0 should be fine)
@@ -71,7 +257,7 @@ class IthoRFTRemote:
 
         # Randomise Remote Address when not configured (e.g. 29:012345 & 0x743039)
         if self.remote_address is None:
-            self.remote_address = f"29:{random.randint(0, 999999):06d}"
+            self.remote_address = f"29:{random.randint(0, 0x03FFFF):06d}"
 
         unit_address_info = (
             f"Remote paired to: {self.unit_address}"
@@ -91,6 +277,53 @@ class IthoRFTRemote:
             )
             _LOGGER.debug("Started")
 
+    @property
+    def remote_address(self):
+        """"The virtual address of the remote (e.g. 29:012345)."""
+
+        return self._remote_address
+
+    @remote_address.setter
+    def remote_address(self, remote_address):
+        """"Set the remote address and rebuild the frames that embed it."""
+
+        self._refresh_remote_address(remote_address)
+        self._remote_address = remote_address
+
+    def _refresh_remote_address(self, remote_address):
+        """"Precompute the remote address dependent pair and command frames."""
+
+        if remote_address is None:
+            self._remote_address_int = None
+            self._pair_frame = None
+            self._command_frames = {}
+            return
+
+        # Pair requires remote address in integer format (6 bit class, 18 bit id)
+        if not _is_device_address(remote_address):
+            raise ValueError(
+                f"Invalid remote address: {remote_address!r} (expected e.g. 29:012345)"
+            )
+        device_class = int(remote_address[:2])
+        device_id = int(remote_address[3:])
+        if device_class > 0x3F or device_id > 0x03FFFF:
+            raise ValueError(
+                f"Invalid remote address: {remote_address!r} (class <= 63, id <= 262143)"
+            )
+        self._remote_address_int = (device_class << 18) + device_id
+
+        # Pre-encoded frames, the sequence number is patched in on every send
+        frame_header = f" I 000 --:------ --:------ {remote_address} "
+        self._pair_frame = bytearray(
+            f"{frame_header}1FC9 012 "
+            f"6322F8{self._remote_address_int:06X}0110E0{self._remote_address_int:06X}\r\n",
+            "utf-8",
+        )
+        self._command_frames = {
+            command: bytearray(f"{frame_header}{payload}\r\n", "utf-8")
+            for command, payload in _COMMAND_MAP.items()
+        }
+
     def _config_load(self):
         """"Load Itho RFT Remote configuration from ./settings.json file."""
 
@@ -103,15 +336,25 @@ class IthoRFTRemote:
                     "remote_address", self.remote_address
                 )
                 self.unit_address = settings.get("unit_address", self.unit_address)
+                self._saved_settings = (
+                    settings.get("remote_address"), settings.get("unit_address")
+                )
                 _LOGGER.debug("Settings loaded")
         except FileNotFoundError:
             _LOGGER.error("Settings file does not exist")
         except json.JSONDecodeError:
             _LOGGER.error("Settings file corrupt")
+        except ValueError as err:
+            _LOGGER.error(f"Settings file corrupt: {err}")
 
     def _config_save(self):
         """"Save Itho RFT Remote configuration to ./settings.json file."""
 
+        # Skip the write when the file already holds these settings
+        saved_settings = (self.remote_address, self.unit_address)
+        if saved_settings == self._saved_settings:
+            return
+
         _LOGGER.debug("Itho RFT Remote saving to ./settings.json")
 
         settings = {
@@ -119,20 +362,43 @@ class IthoRFTRemote:
             "unit_address": self.unit_address,
         }
 
-        with open("settings.json", "w", encoding="utf8") as file:
+        # Write to a temporary file first so a crash never leaves a corrupt file
+        with open("settings.json.tmp", "w", encoding="utf8") as file:
             json.dump(settings, file, indent=4)
-            print("Settings saved")
+        os.replace("settings.json.tmp", "settings.json")
+        self._saved_settings = saved_settings
+        _LOGGER.debug("Settings saved")
 
     def _log_to_file(self, data):
         """"Log data to itho_remote_<date>.log file and keep 7 day history."""
 
-        log_directory = os.getcwd()
-        logfile_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        log_timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_filename = os.path.join(log_directory, f"itho_remote_{logfile_date}.log")
+        now = datetime.datetime.now()
+        logfile_date = now.date()
+
+        # (Re)open the line buffered log file only once per day (on date rollover)
+        if logfile_date != self._log_date or self._log_file is None:
+            self._close_log_file()
+            log_directory = os.getcwd()
+            log_filename = os.path.join(
+                log_directory, f"itho_remote_{logfile_date.isoformat()}.log"
+            )
+            self._log_file = open(log_filename, "a", buffering=1, encoding="utf8")
+            self._log_date = logfile_date
+            self._prune_log_files(log_directory)
+
+        # YYYY-MM-DD HH:MM:SS, isoformat is cheaper than strftime
+        self._log_file.write(f"{now.isoformat(' ', 'seconds')}: {data}\n")
+
+    def _close_log_file(self):
+        """"Close the itho_remote_<date>.log file (if open)."""
 
-        with open(log_filename, "a", encoding="utf8") as file:
-            file.write(f"{log_timestamp}: {data}\n")
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    @staticmethod
+    def _prune_log_files(log_directory):
+        """"Remove all but the 7 most recent itho_remote_<date>.log files."""
 
         log_files = sorted([file for file in os.listdir(log_directory) if
                             file.endswith('.log') and file.startswith('itho_remote')])
@@ -148,317 +414,341 @@ class IthoRFTRemote:
         else:
             raise IthoRemoteGatewayError("Gateway communication lost!") from Exception
 
+    def _send_frame(self, frame):
+        """"Send a pre-encoded frame with the current sequence number to evofw3 gateway."""
+
+        if self.serial_connection:
+            frame[3:6] = b"%03d" % (self.sequence_number % 1000)
+            self.serial_connection.write(frame)
+        else:
+            raise IthoRemoteGatewayError("Gateway communication lost!") from Exception
+
     def _receive_data(self):
         """"Receive non-blocking data (until newline) from the evofw3 gateway."""
 
         if self.serial_connection:
-            data = self.serial_connection.readline().decode().strip()
-            return data if data else None
+            # Return the next complete line, partial lines stay buffered
+            while True:
+                index = self._receive_buffer.find(b"\n")
+                if index < 0:
+                    # Only touch the port when no complete line is buffered, then
+                    # drain everything the OS has buffered in a single read
+                    waiting = self.serial_connection.in_waiting
+                    if not waiting:
+                        return None
+                    self._receive_buffer += self.serial_connection.read(waiting)
+                    continue
+
+                data = self._receive_buffer[:index].decode(errors="ignore").strip()
+                del self._receive_buffer[:index + 1]
+                if data:
+                    return data
 
         else:
             raise IthoRemoteGatewayError("Gateway communication lost!") from Exception
 
+    def _receive_data_blocking(self):
+        """"Receive blocking data (until newline or serial timeout) from the evofw3 gateway."""
+
+        while True:
+            data = self._receive_data()
+            if data is not None:
+                return data
+
+            # Wait for the next byte, the serial timeout bounds the wait
+            chunk = self.serial_connection.read(1)
+            if not chunk:
+                return None
+            self._receive_buffer += chunk
+
     async def _loop_task(self):
         """"Periodic task to run Itho RFT Remote."""
 
-        regex_pattern = (
-            "(?P<RSSI>\\d{3}) (?P<VERB> I|RQ|RP| W) (?P<SEQNR>---|\\d{3}) "
-            "(?P<ADDR1>--:------|\\d{2}:\\d{6}) "
-            "(?P<ADDR2>--:------|\\d{2}:\\d{6}) "
-            "(?P<ADDR3>--:------|\\d{2}:\\d{6}) "
-            "(?P<CODE>[0-9A-F]{4}) (?P<PAYLEN>\\d{3}) (?P<PAYLOAD>[0-9A-F]*)"
-        )
+        loop = asyncio.get_running_loop()
+
+        # Bound to this loop, pair() wakes the task thread-safe through the loop
+        # (create the event before publishing the loop to other threads)
+        self._pairing_started = asyncio.Event()
+        self._loop = loop
+
+        # Wake up on serial data when the platform supports it, otherwise use
+        # blocking reads (with timeout) in a dedicated reader thread
+        reader_stop = threading.Event()
+        try:
+            reader_fd = self.serial_connection.fileno()
+            loop.add_reader(reader_fd, self._on_serial_readable, loop, reader_fd)
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            reader_fd = None
+            self.serial_connection.timeout = 1
+            reader_thread = threading.Thread(
+                target=self._reader_thread,
+                args=(loop, reader_stop),
+                name="IthoRFT reader",
+                daemon=True,
+            )
+            reader_thread.start()
+            _LOGGER.debug("Serial reader not supported, using a reader thread")
 
         try:
             while True:
-                await asyncio.sleep(1)  # Yield control to the event loop
-
-                # Receive data in the loop (can be multiple lines)
-                while True:
-                    data = self._receive_data()
-                    if data is None:
-                        break  # No data available
-
-                    # Process available data
-                    _LOGGER.debug(data)
-
-                    # Log to file?
-                    if self.log_to_file:
-                        self._log_to_file(data)
-
-                    # Capture groups data using regex
-                    match = re.match(regex_pattern, data)
-                    if match:
-
-                        # Verify payload length
-                        if int(len(match.group("PAYLOAD")) / 2) != int(match.group("PAYLEN")):
-                            continue
-
-                        # Handle pairing messages
-                        # 072  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
-                        # 070 RQ --- 18:012345 29:012345 --:------ 10E0 001 63
-                        if self.is_pairing:
-                            if (
-                                    match.group("VERB") == "RQ"
-                                    and match.group("CODE") == "10E0"
-                                    and match.group("ADDR2") == self.remote_address
-                                    and match.group("PAYLOAD") == "63"
-                            ):
-                                self.unit_address = match.group("ADDR1")
-                                self.is_pairing = False
-                                # self._config_save()
-                                _LOGGER.info("Pairing success")
-
-                                # Call pair callback (return remote and unit address on success)
-                                if self.pair_callback is not None:
-                                    self.pair_callback(self.remote_address, self.unit_address)
-
-                            if time.time() > self.pairing_timeout:
-                                self.unit_address = None
-                                self.is_pairing = False
-
-                                _LOGGER.warning("Pairing timeout")
-
-                        # Handle status messages
-                        # 069  I --- 18:012345 --:------ 18:012345 31DA
-                        # 029 00F0007FFFEFEF0884079E085A07714000125850FF0000EFEF41E641E6
-                        if self.unit_address is not None:
-                            if (
-                                    match.group("ADDR1") == self.unit_address
-                                    and match.group("CODE") == "31DA"
-                            ):
-                                _LOGGER.debug("unit status message received")
-
-                                # Parse & Print
-                                payload = match.group("PAYLOAD")
-                                self._parse_status(payload)
-                                # Pretty print dictionary as json
-                                pretty_data = json.dumps(self.data, indent=4)
-                                _LOGGER.debug(pretty_data)
-
-                                # Call data callback
-                                if self.data_callback is not None:
-                                    self.data_callback(self.data)
+                if self.is_pairing:
+                    await asyncio.sleep(1)  # Pairing timeout watchdog
+                else:
+                    # Nothing to wait for, sleep until pair() starts the pairing watchdog
+                    self._pairing_started.clear()
+                    await self._pairing_started.wait()
+                    continue
+
+                # Check the pairing timeout once per pass (not per received line)
+                if self.is_pairing and time.time() > self.pairing_timeout:
+                    self.unit_address = None
+                    self.is_pairing = False
+
+                    _LOGGER.warning("Pairing timeout")
 
         except asyncio.CancelledError:
             _LOGGER.warning("Itho RFT Remote task cancelled")
         finally:
+            if reader_fd is not None:
+                loop.remove_reader(reader_fd)
+            else:
+                # Wait for the pending read to return before leaving blocking IO mode
+                reader_stop.set()
+                await loop.run_in_executor(None, reader_thread.join)
+                try:
+                    if self.serial_connection:
+                        self.serial_connection.timeout = 0  # Back to non-blocking IO mode
+                except serial.SerialException:
+                    pass  # Gateway lost, nothing to restore
+            self._close_log_file()
+            self._loop = None
             self.task = None
 
+    def _on_serial_readable(self, loop, reader_fd):
+        """"Event loop reader callback, process all complete lines from the evofw3 gateway."""
+
+        # Receive data in the loop (can be multiple lines)
+        while True:
+            try:
+                data = self._receive_data()
+            except (OSError, serial.SerialException):
+                # A disconnected port stays readable, stop instead of spinning
+                loop.remove_reader(reader_fd)
+                _LOGGER.error("Gateway communication lost!")
+                self.stop_task()
+                return
+
+            if data is None:
+                break  # No data available
+
+            self._process_received(data)
+
+    def _reader_thread(self, loop, stop):
+        """"Reader thread, blocking receive and hand the lines to the event loop."""
+
+        while not stop.is_set():
+            try:
+                data = self._receive_data_blocking()
+            except (OSError, serial.SerialException):
+                _LOGGER.error("Gateway communication lost!")
+                loop.call_soon_threadsafe(self.stop_task)
+                return
+
+            if data is not None:
+                loop.call_soon_threadsafe(self._process_received, data)
+
+    def _process_received(self, data):
+        """"Process a received line, a failing line is logged and skipped."""
+
+        try:
+            self._process_data(data)
+        except Exception:
+            _LOGGER.exception(f"Failed to process received data: {data}")
+
+    def _process_data(self, data):
+        """"Process a single line received from the evofw3 gateway."""
+
+        _LOGGER.debug(data)
+
+        # Log to file?
+        if self.log_to_file:
+            self._log_to_file(data)
+
+        # Only status from the paired unit and pairing replies are handled, check
+        # this first as it rejects most traffic (other devices on the channel)
+        code = data[41:45]
+        addr1 = data[11:20]
+        if not (
+                (code == "31DA" and addr1 == self.unit_address)
+                or (code == "10E0" and self.is_pairing)
+        ):
+            return
+
+        # Reject lines that can never be a frame
+        if not _is_frame(data):
+            return
+
+        # Slice the remaining fixed-width fields
+        verb = data[4:6]
+        addr2 = data[21:30]
+        paylen = data[46:49]
+        payload = data[50:]
+
+        # Verify payload length
+        if not paylen.isdigit() or len(payload) != int(paylen) * 2:
+            return
+
+        # Handle pairing messages
+        # 072  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
+        # 070 RQ --- 18:012345 29:012345 --:------ 10E0 001 63
+        if self.is_pairing:
+            if (
+                    verb == "RQ"
+                    and code == "10E0"
+                    and addr2 == self.remote_address
+                    and payload == "63"
+                    and _is_device_address(addr1)
+            ):
+                self.unit_address = addr1
+                self.is_pairing = False
+                # self._config_save()
+                _LOGGER.info("Pairing success")
+
+                # Call pair callback (return remote and unit address on success)
+                if self.pair_callback is not None:
+                    self.pair_callback(self.remote_address, self.unit_address)
+
+        # Handle status messages
+        # 069  I --- 18:012345 --:------ 18:012345 31DA
+        # 029 00F0007FFFEFEF0884079E085A07714000125850FF0000EFEF41E641E6
+        if self.unit_address is not None:
+            if addr1 == self.unit_address and code == "31DA":
+                _LOGGER.debug("unit status message received")
+
+                # Parse & Print
+                try:
+                    self._parse_status(payload)
+                except (ValueError, struct.error):
+                    _LOGGER.debug("unit status message invalid")
+                    return
+
+                # Pretty print dictionary as json (only when it is logged)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    pretty_data = json.dumps(self.data, indent=4)
+                    _LOGGER.debug(pretty_data)
+
+                # Call data callback
+                if self.data_callback is not None:
+                    self.data_callback(self.data)
+
     def _parse_status(self, payload):
         """"Parse unit status messages."""
 
-        pos = payload
-
-        # unk = b[0:2]
+        # Decode the hex payload once and unpack all fields in a single call
+        (
+            _,  # unk
+            air_quality_raw,
+            quality_base,
+            co2_level_raw,
+            outdoor_humidity_raw,
+            indoor_humidity_raw,
+            exhaust_temperature_raw,
+            supply_temperature_raw,
+            indoor_temperature_raw,
+            outdoor_temperature_raw,
+            capability_flags_raw,
+            bypass_position_raw,
+            flags_raw,
+            exhaust_fan_speed_raw,
+            inlet_fan_speed_raw,
+            remaining_time,
+            post_heater_raw,
+            pre_heater_raw,
+            inlet_flow_raw,
+            exhaust_flow_raw,
+        ) = _STATUS_STRUCT.unpack_from(bytes.fromhex(payload))
 
         # Parse air quality (%)
-        air_quality_raw = int(pos[2:4], 16) / 2
-        air_quality = air_quality_raw if 0.0 <= air_quality_raw <= 100.0 else None
-
-        # Parse quality (bitmask)
-        quality_base = int(pos[4:6], 16)
-        quality_base_rh = bool(quality_base & 0b10000000)
-        quality_base_co = bool(quality_base & 0b01000000)
-        quality_base_voc = bool(quality_base & 0b00100000)
-        quality_base_outdoor_improved = bool(quality_base & 0b00010000 == 0)
+        air_quality = _percentage(air_quality_raw)
 
         # Parse Co2 level (ppm)
-        co2_level_raw = int(pos[6:10], 16)
-        co2_level = co2_level_raw if 0 <= co2_level_raw <= 0x3FFF else None
+        co2_level = _clip(co2_level_raw, 0, 0x3FFF)
 
         # Parse Outdoor/Indoor Humidity (%)
-        outdoor_humidity_raw = int(pos[10:12], 16)
-        outdoor_humidity = (
-            outdoor_humidity_raw if 0 <= outdoor_humidity_raw <= 100 else None
-        )
-        indoor_humidity_raw = int(pos[12:14], 16)
-        indoor_humidity = (
-            indoor_humidity_raw if 0 <= indoor_humidity_raw <= 100 else None
-        )
+        outdoor_humidity = _clip(outdoor_humidity_raw, 0, 100)
+        indoor_humidity = _clip(indoor_humidity_raw, 0, 100)
 
         # Parse HRU channel temperatures (°C)
-        exhaust_temperature_raw = int(pos[14:18], 16)
-        exhaust_temperature_raw -= (
-            0x10000 if exhaust_temperature_raw & 0x8000 else 0
-        )  # Parse signed int
-        exhaust_temperature_raw = exhaust_temperature_raw / 100.0
-        exhaust_temperature = (
-            exhaust_temperature_raw
-            if -273.15 <= exhaust_temperature_raw <= 327.66
-            else None
-        )
-
-        supply_temperature_raw = int(pos[18:22], 16)
-        supply_temperature_raw -= (
-            0x10000 if supply_temperature_raw & 0x8000 else 0
-        )  # Parse signed int
-        supply_temperature_raw = supply_temperature_raw / 100.0
-        supply_temperature = (
-            supply_temperature_raw
-            if -273.15 <= supply_temperature_raw <= 327.66
-            else None
-        )
-
-        indoor_temperature_raw = int(pos[22:26], 16)
-        indoor_temperature_raw -= (
-            0x10000 if indoor_temperature_raw & 0x8000 else 0
-        )  # Parse signed int
-        indoor_temperature_raw = indoor_temperature_raw / 100.0
-        indoor_temperature = (
-            indoor_temperature_raw
-            if -273.15 <= indoor_temperature_raw <= 327.66
-            else None
-        )
-
-        outdoor_temperature_raw = int(pos[26:30], 16)
-        outdoor_temperature_raw -= (
-            0x10000 if outdoor_temperature_raw & 0x8000 else 0
-        )  # Parse signed int
-        outdoor_temperature_raw = outdoor_temperature_raw / 100.0
-        outdoor_temperature = (
-            outdoor_temperature_raw
-            if -273.15 <= outdoor_temperature_raw <= 327.66
-            else None
-        )
+        exhaust_temperature = _temperature(exhaust_temperature_raw)
+        supply_temperature = _temperature(supply_temperature_raw)
+        indoor_temperature = _temperature(indoor_temperature_raw)
+        outdoor_temperature = _temperature(outdoor_temperature_raw)
 
         # Capability flags (bitmask)
-        capability_flags_raw = int(pos[30:34], 16)
-        capability_names = [
-            "Off",
-            "Away",
-            "Timer",
-            "Boost",
-            "Auto",
-            "Speed 4",
-            "Speed 5",
-            "Speed 6",
-            "Speed 7",
-            "Speed 8",
-            "Speed 9",
-            "Speed 10",
-            "Night",
-            "Reserved",
-            "Post Heater",
-            "Pre Heater",
-        ]
-        set_capabilities = [
-            capability_names[i]
-            for i in range(16)
-            if capability_flags_raw & (1 << (15 - i))
-        ]
-        capability_flags = ", ".join(set_capabilities)
+        capability_flags = _CAPABILITY_CACHE.get(capability_flags_raw)
+        if capability_flags is None:
+            capability_flags = ", ".join(
+                name for mask, name in _CAPABILITY_TABLE if capability_flags_raw & mask
+            )
+            _CAPABILITY_CACHE[capability_flags_raw] = capability_flags
 
         # Parse bypass position (%)
-        bypass_position_raw = int(pos[34:36], 16) / 2
-        bypass_position = (
-            bypass_position_raw if 0.0 <= bypass_position_raw <= 100.0 else None
-        )
+        bypass_position = _percentage(bypass_position_raw)
 
-        # Flags (bitmask)
-        flags_raw = int(pos[36:38], 16)
-        flags_fault_active = bool(flags_raw & 0b10000000)
-        flags_filter_dirty = bool(flags_raw & 0b01000000)
-        flags_defrost_active = bool(flags_raw & 0b00100000)
-        flags_active_speed_mode_raw = int(flags_raw & 0b00011111)
-        active_speed_mode_mapping = {
-            0: "OFF",
-            1: "Speed 1",
-            2: "Speed 2",
-            3: "Speed 3",
-            4: "Speed 4",
-            5: "Speed 5",
-            6: "Speed 6",
-            7: "Speed 7",
-            8: "Speed 8",
-            9: "Speed 9",
-            10: "Speed 10",
-            11: "Speed 1 Temporary Override",
-            12: "Speed 2 Temporary Override",
-            13: "Speed 3 Temporary Override",
-            14: "Speed 4 Temporary Override",
-            15: "Speed 5 Temporary Override",
-            16: "Speed 6 Temporary Override",
-            17: "Speed 7 Temporary Override",
-            18: "Speed 8 Temporary Override",
-            19: "Speed 9 Temporary Override",
-            20: "Speed 10 Temporary Override",
-            21: "Away",
-            22: "Abs Minimum Speed",
-            23: "Abs Maximum Speed",
-            24: "Auto",
-            25: "Night",
-        }
-        flags_active_speed_mode = active_speed_mode_mapping.get(
+        # Parse active speed mode (lower bits of the flags bitmask)
+        flags_active_speed_mode_raw = flags_raw & 0b00011111
+        flags_active_speed_mode = _ACTIVE_SPEED_MODES.get(
             flags_active_speed_mode_raw, "Unknown"
         )
 
         # Parse fan speed inlet/exhaust (%)
-        exhaust_fan_speed_raw = int(pos[38:40], 16) / 2
-        exhaust_fan_speed = (
-            exhaust_fan_speed_raw if 0.0 <= exhaust_fan_speed_raw <= 100.0 else None
-        )
-        inlet_fan_speed_raw = int(pos[40:42], 16) / 2
-        inlet_fan_speed = (
-            inlet_fan_speed_raw if 0.0 <= inlet_fan_speed_raw <= 100.0 else None
-        )
-
-        # Parse remaining time (minutes)
-        remaining_time = int(pos[42:46], 16)
+        exhaust_fan_speed = _percentage(exhaust_fan_speed_raw)
+        inlet_fan_speed = _percentage(inlet_fan_speed_raw)
 
         # Parse heater pre/post (%)
-        post_heater_raw = int(pos[46:48], 16) / 2
-        post_heater = post_heater_raw if 0.0 <= post_heater_raw <= 100.0 else None
-        pre_heater_raw = int(pos[48:50], 16) / 2
-        pre_heater = pre_heater_raw if 0.0 <= pre_heater_raw <= 100.0 else None
+        post_heater = _percentage(post_heater_raw)
+        pre_heater = _percentage(pre_heater_raw)
 
         # Parse flow inlet/exhaust (m3/h)
-        inlet_flow_raw = int(pos[50:54], 16)
-        inlet_flow = inlet_flow_raw / 100.0 if 0 <= inlet_flow_raw <= 0x7FFF else None
-        exhaust_flow_raw = int(pos[54:58], 16)
-        exhaust_flow = exhaust_flow_raw / 100.0 if 0 <= exhaust_flow_raw <= 0x7FFF else None
-
-        # Dictionary
-        self.data = {
-            "air_quality": air_quality,
-            "quality_base": {
-                "th": quality_base_rh,
-                "co": quality_base_co,
-                "voc": quality_base_voc,
-                "outdoor_improved": quality_base_outdoor_improved,
-            },
-            "co2_level": co2_level,
-            "outdoor_humidity": outdoor_humidity,
-            "indoor_humidity": indoor_humidity,
-            "exhaust_temperature": exhaust_temperature,
-            "supply_temperature": supply_temperature,
-            "indoor_temperature": indoor_temperature,
-            "outdoor_temperature": outdoor_temperature,
-            "capability_flags": capability_flags,
-            "bypass_position": bypass_position,
-            "flags": {
-                "fault_active": flags_fault_active,
-                "filter_dirty": flags_filter_dirty,
-                "defrost_active": flags_defrost_active,
-                "active_speed_mode": flags_active_speed_mode,
-            },
-            "exhaust_fan_speed": exhaust_fan_speed,
-            "inlet_fan_speed": inlet_fan_speed,
-            "remaining_time": remaining_time,
-            "pos_theater": post_heater,
-            "pre_heater": pre_heater,
-            "inlet_flow": inlet_flow,
-            "exhaust_flow": exhaust_flow,
-        }
+        inlet_flow = _clip(inlet_flow_raw / 100.0, 0.0, 0x7FFF / 100.0)
+        exhaust_flow = _clip(exhaust_flow_raw / 100.0, 0.0, 0x7FFF / 100.0)
+
+        # Update the dictionary in place (keeps references held by callbacks valid)
+        data = self.data
+        data["air_quality"] = air_quality
+        # Quality (bitmask)
+        quality_base_data = data["quality_base"]
+        for name, mask in _QUALITY_BASE_MASKS:
+            quality_base_data[name] = bool(quality_base & mask)
+        quality_base_data["outdoor_improved"] = not quality_base & 0b00010000
+        data["co2_level"] = co2_level
+        data["outdoor_humidity"] = outdoor_humidity
+        data["indoor_humidity"] = indoor_humidity
+        data["exhaust_temperature"] = exhaust_temperature
+        data["supply_temperature"] = supply_temperature
+        data["indoor_temperature"] = indoor_temperature
+        data["outdoor_temperature"] = outdoor_temperature
+        data["capability_flags"] = capability_flags
+        data["bypass_position"] = bypass_position
+        # Flags (bitmask)
+        flags_data = data["flags"]
+        for name, mask in _FLAGS_MASKS:
+            flags_data[name] = bool(flags_raw & mask)
+        flags_data["active_speed_mode"] = flags_active_speed_mode
+        data["exhaust_fan_speed"] = exhaust_fan_speed
+        data["inlet_fan_speed"] = inlet_fan_speed
+        data["remaining_time"] = remaining_time
+        data["pos_theater"] = post_heater
+        data["pre_heater"] = pre_heater
+        data["inlet_flow"] = inlet_flow
+        data["exhaust_flow"] = exhaust_flow
 
     def self_test(self):
-        """"Blocking self-test Itho RFT Remote."""
+        """"Blocking self-test Itho RFT Remote (not while the task is running)."""
 
         # When the version number can be retrieved, the dongle is operational.
         _LOGGER.debug("Itho RFT Remote evofw3 self-test")
 
-        regex_version = "# evofw3 (?P<VERSION>\\d.\\d.\\d)"
-
         if not self.serial_connection:
             raise IthoRemoteGatewayError("Gateway not connected!") from Exception
 
@@ -473,10 +763,9 @@ class IthoRFTRemote:
             timeout = time.time() + TIMEOUT_SELF_TEST
             while time.time() < timeout:
                 data = self.serial_connection.readline().decode().strip()
-                match = re.match(regex_version, data)
-                if match:
-                    version = match.group("VERSION")
-                    if version >= REQUIRED_EVOFW3_VERSION:
+                if data.startswith(_VERSION_PREFIX):
+                    version = data[len(_VERSION_PREFIX):].split()[0]
+                    if _version_tuple(version) >= _REQUIRED_VERSION:
                         _LOGGER.debug("evofw3 version-check OK: " + version)
                     else:
                         _LOGGER.error("evofw3 version-check fail")
@@ -493,6 +782,8 @@ class IthoRFTRemote:
 
         except serial.SerialException:
             raise IthoRemoteGatewayError("Gateway communication fail!") from Exception
+        finally:
+            self.serial_connection.timeout = 0  # Back to non-blocking IO mode
 
     # Public functions
     def register_pair_callback(self, callback):
@@ -523,13 +814,21 @@ class IthoRFTRemote:
         else:
             _LOGGER.warning("Itho RFT Remote task is already stopped")
 
+    def close(self):
+        """"Closes the Itho RFT Remote log file and evofw3 gateway connection.
+
+        Not while the task is running, wait for the stopped task to finish first
+        (the reader thread may still be using the connection)."""
+
+        self._close_log_file()
+        if self.serial_connection:
+            self.serial_connection.close()
+            self.serial_connection = None
+            _LOGGER.debug("Itho RFT Remote closed")
+
     def pair(self):
         """"Starts Itho RFT Remote pairing procedure."""
 
-        # Pair requires remote address in integer format
-        convert = self.remote_address.split(":")
-        remote_address_int = (int(convert[0]) << 18) + int(convert[1])
-
         # 074  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
         # 074  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
         # 072  I 022 --:------ --:------ 29:012345 1FC9 012 6322F87430390110E0743039
@@ -540,16 +839,17 @@ class IthoRFTRemote:
         #   00F0007FFFEFEF07CB07C5086E07994000C85850FF0000EFEF402E402E
         if self.remote_address is not None:
             # Send the pair command
-            data = (
-                f" I {self.sequence_number:03} --:------ --:------ {self.remote_address} "
-                f"1FC9 012 6322F8{remote_address_int:X}0110E0{remote_address_int:X}\r\n"
-            )
-            self._send_data(data)
-            _LOGGER.debug("Itho RFT Remote pairing command send: " + data)
+            self._send_frame(self._pair_frame)
+            _LOGGER.debug("Itho RFT Remote pairing command send: " + self._pair_frame.decode())
 
             self.sequence_number += 1
             self.pairing_timeout = time.time() + TIMEOUT_PAIRING
             self.is_pairing = True
+
+            # Wake the loop task to run the pairing watchdog (pair() may run in another thread)
+            loop = self._loop
+            if loop is not None:
+                loop.call_soon_threadsafe(self._pairing_started.set)
             _LOGGER.info("Itho RFT Remote pairing pending...")
 
     def command(self, command):
@@ -565,28 +865,15 @@ class IthoRFTRemote:
         # timer10:  ' I 058 --:------ --:------ 29:012345 22F3 003 63000A'
         # timer20:  ' I 059 --:------ --:------ 29:012345 22F3 003 630014'
         # timer30:  ' I 060 --:------ --:------ 29:012345 22F3 003 63001E'
-        command_map = {
-            "night": "22F8 003 630203",
-            "auto": "22F1 003 630304",
-            "low": "22F1 003 630204",
-            "high": "22F1 003 630404",
-            "timer10": "22F3 003 63000A",
-            "timer20": "22F3 003 630014",
-            "timer30": "22F3 003 63001E",
-        }
-
-        if command in command_map:
-            data = (
-                f" I {self.sequence_number:03} --:------ --:------ {self.remote_address} "
-                f"{command_map[command]}\r\n"
-            )
-            self._send_data(data)
+        frame = self._command_frames.get(command)
+        if frame is not None:
+            self._send_frame(frame)
             self.sequence_number += 1
-            _LOGGER.debug("Itho RFT Remote {command} command send: " + data.strip())
+            _LOGGER.debug(f"Itho RFT Remote {command} command send: " + frame.decode().strip())
 
         else:
             _LOGGER.warning(
-                "Invalid command. Supported commands: night, auto, low, high, timer10, timer20, timer30"
+                "Invalid command. Supported commands: " + ", ".join(_COMMAND_MAP)
             )
 
     def request_data(self):